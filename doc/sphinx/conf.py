@@ -17,7 +17,7 @@ import sys
 # We need to do the path management here because Read the Docs doesn't support
 # the use of a makefile.
 # Add this directory to the path so that we can import reverse_sphinx_path. 
-sphinx_path = Path('__file__').parent.resolve()
+sphinx_path = Path(__file__).parent.resolve()
 # This doesn't work if we don't convert the path to a string!
 sys.path.append(str(sphinx_path))
 
@@ -25,7 +25,9 @@ from reverse_sphinx_path import REVERSE_SPHINX_PATH
 
 # With REVERSE_SPHINX_PATH we can add the TurboCtl directory to the path and
 # import turboctl. 
-TurboCtl_path = Path(REVERSE_SPHINX_PATH).resolve()
+# REVERSE_SPHINX_PATH is relative to this directory, not to the working
+# directory.
+TurboCtl_path = (sphinx_path / REVERSE_SPHINX_PATH).resolve()
 sys.path.append(str(TurboCtl_path))
 
 
@@ -85,6 +87,9 @@ intersphinx_mapping = {'python': ('https://docs.python.org/3', None),
 					   'serial': ('https://pyserial.readthedocs.io/en/latest', None),
 					   'urwid': ('http://urwid.org', None),}
 
+# Don't let a slow or unreachable inventory server stall the build.
+intersphinx_timeout = 5
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
@@ -174,8 +174,26 @@ def main():
         '.readthedocs.yaml': readthedocs}
 
     for name, contents in names_and_contents.items():
-        with open(name, 'w') as file:
-            file.write(contents)
+        _write_if_changed(name, contents)
+
+
+def _write_if_changed(name, contents):
+    """Write *contents* into the file *name*, unless the file already 
+    contains exactly that.
+    
+    Leaving unchanged files alone preserves their modification times, 
+    so Sphinx doesn't think index.rst has changed and rebuild every page 
+    that depends on it.
+    """
+    try:
+        with open(name) as file:
+            if file.read() == contents:
+                return
+    except FileNotFoundError:
+        pass
+
+    with open(name, 'w') as file:
+        file.write(contents)
 
 
 if __name__ == '__main__':
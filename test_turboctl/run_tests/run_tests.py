@@ -1,7 +1,9 @@
 """Run all unit tests at once."""
 import unittest
 import importlib
-import tabulate
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Comment module names away to exclude certain modules 
 # from being tested. 
@@ -66,25 +68,32 @@ class Module():
         
         return res
         
+    @property
+    def import_name(self):
+        """The full dotted name used to import this module."""
+        return f'test_turboctl.{self.package_name}.{self.name}'
+        
     def run_tests(self):
         """Run all tests in this module and record their results."""
         
-        module = importlib.import_module(
-            f'test_turboctl.{self.package_name}.{self.name}')
+        module = importlib.import_module(self.import_name)
         suite = unittest.defaultTestLoader.loadTestsFromModule(module)
         result = unittest.TestResult()    
         suite.run(result)
         
         self.tests_run = result.testsRun
         
-        self.failures = [
-            FailedResult('failure', *fields) for fields in result.failures]
+        # Test names are stored as strings instead of TestCase objects,
+        # because the results have to be pickled to get them out of 
+        # the worker process.
+        self.failures = [FailedResult('failure', str(test), message)
+                         for test, message in result.failures]
         
-        self.errors = [
-            FailedResult('error', *fields) for fields in result.errors]
+        self.errors = [FailedResult('error', str(test), message)
+                       for test, message in result.errors]
         
-        self.skipped = [
-            FailedResult('skipped', *fields) for fields in result.skipped]
+        self.skipped = [FailedResult('skipped', str(test), message)
+                        for test, message in result.skipped]
         
     @property
     def n_failures(self):
@@ -134,8 +143,26 @@ def run_tests():
                for pkg, mods_in_pkg in sorted(MODS_BY_PKG.items()) 
                for mod in sorted(mods_in_pkg)]
     
+    # Import everything up front, so that forked worker processes inherit
+    # the imported modules (and turboctl, which they all import) instead of
+    # each importing them again. This only helps with the 'fork' start 
+    # method, so it is requested explicitly where it is available; other
+    # methods start each worker from scratch.
     for mod in modlist:
-        mod.run_tests()
+        importlib.import_module(mod.import_name)
+    
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+    else:
+        mp_context = None
+    
+    # The modules are independent of each other, so they can be tested in
+    # parallel. A couple of cores are left free to keep the machine 
+    # responsive.
+    workers = max(1, (os.cpu_count() or 1) - 2)
+    with ProcessPoolExecutor(max_workers=workers, 
+                             mp_context=mp_context) as executor:
+        modlist = list(executor.map(_run_one, modlist))
     
     used_pkgs = set()
     
@@ -162,6 +189,15 @@ def run_tests():
     print()
     _print_messages(modlist)
 
+def _run_one(module):
+    """Run the tests in *module* and return it.
+    
+    This is a top-level function so that it can be pickled and sent to a
+    worker process.
+    """
+    module.run_tests()
+    return module
+
 def _print_results(results):    
     """Print a table displaying the quantities of different test 
     results.
@@ -173,7 +209,25 @@ def _print_results(results):
     """
     
     headers = ['Package', 'Module', 'Total', 'Failures', 'Errors', 'Skipped']
-    print(tabulate.tabulate(results, headers=headers))
+    
+    # The table is small and simple enough that it's not worth importing
+    # tabulate for it. This mimics tabulate's default format: text is 
+    # aligned left and numbers right, and each column is at least 2 
+    # characters wider than its header.
+    rows = [[str(field) for field in row] for row in results]
+    widths = [max([len(header) + 2] + [len(row[i]) for row in rows])
+              for i, header in enumerate(headers)]
+    aligns = [str.ljust if isinstance(field, str) else str.rjust 
+              for field in results[0]]
+    
+    def line(fields):
+        return '  '.join(align(field, width) 
+                         for field, width, align in zip(fields, widths, aligns))
+    
+    print(line(headers))
+    print('  '.join('-' * width for width in widths))
+    for row in rows:
+        print(line(row))
     
 def _print_messages(modlist):
     """Print messages detailing all unsuccessful tests."""
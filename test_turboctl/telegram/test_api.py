@@ -1,40 +1,98 @@
-"""Unit tests for the api module."""
+"""Unit tests for the api module.
 
-import unittest
+By default the tests talk to a VirtualPump through a serial connection.
+If the environment variable ``TURBOCTL_TEST_INPROC`` is set to a non-empty 
+value, telegrams are instead passed to the pump directly rather than through
+the pseudoterminal. The pump still opens the pseudoterminal and starts the
+thread that serves it; only the data path bypasses them.
+"""
 
-import serial
+import os
+import unittest
 
 from turboctl.telegram import api
 from turboctl.telegram.codes import ControlBits
-from turboctl.virtualpump.virtualpump import VirtualPump
+
+
+class _InProcessConnection():
+    """A stand-in for :class:`serial.Serial` that hands written data 
+    directly to :meth:`VirtualPump.process` and buffers the reply.
+    """
+    
+    def __init__(self, pump):
+        self.pump = pump
+        self._buffer = b''
+        
+    def write(self, data):
+        self._buffer += self.pump.process(bytes(data))
+        return len(data)
+    
+    def read(self, size=1):
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+    
+    def reset_input_buffer(self):
+        self._buffer = b''
+    
+    def close(self):
+        self._buffer = b''
 
 
 class TestApi(unittest.TestCase):
     
-    def setUp(self):
-        self.vp = VirtualPump()
-        self.connection = serial.Serial(self.vp.connection.port, timeout=1)
+    # All tests share one virtual pump and connection, since starting them
+    # for each test is slower than the tests themselves.
+    
+    @classmethod
+    def setUpClass(cls):
+        # These are imported here so that merely importing this module 
+        # (e.g. when collecting tests) doesn't pay for them.
+        import serial
+        from turboctl.virtualpump.virtualpump import VirtualPump
+        
+        cls.vp = VirtualPump()
+        if os.environ.get('TURBOCTL_TEST_INPROC'):
+            cls.connection = _InProcessConnection(cls.vp)
+        else:
+            cls.connection = serial.Serial(cls.vp.connection.port, timeout=1)
+        
+    @classmethod
+    def tearDownClass(cls):
+        cls.connection.close()
+        cls.vp.stop()
         
-    def tearDown(self):
-        self.vp.stop()
+    def setUp(self):
+        # Each test starts with the pump off and stopped. off() only resets
+        # the temperature, current and voltage, so the frequency, which would
+        # otherwise keep decaying from an earlier test, is reset as well.
+        # Other parameter values are shared between tests; this is fine
+        # since the tests only read back values they have written themselves.
+        with self.vp.lock:
+            hardware = self.vp.hardware_component
+            hardware.off()
+            hardware.frequency = 0.0
+            hardware.variables.frequency = 0
+        # Discard any reply left unread by a test that failed or timed out,
+        # so that it isn't mistaken for the reply to the next query.
+        self.connection.reset_input_buffer()
         
     def test_test(self):
         self.assertTrue(True)
         
     def check_parameter(self, telegram, type_, mode, number, value, index):
-        self.assertEqual(telegram.type, type_)
-        self.assertEqual(telegram.parameter_mode, mode)
-        self.assertEqual(telegram.parameter_number, number)
-        self.assertEqual(telegram.parameter_value, value)
-        self.assertEqual(telegram.parameter_index, index)
+        # Comparing tuples checks all fields at once and shows all of them
+        # if any differ.
+        self.assertEqual(
+            (telegram.type, telegram.parameter_mode, telegram.parameter_number,
+             telegram.parameter_value, telegram.parameter_index),
+            (type_, mode, number, value, index))
         
     def check_hardware(self, telegram, frequency, temperature, current,
                        voltage, bits):
-        self.assertEqual(telegram.type, 'query')
-        self.assertEqual(telegram.frequency, 0)
-        self.assertEqual(telegram.temperature, 0)
-        self.assertEqual(telegram.current, 0)
-        self.assertEqual(telegram.voltage, 0)
+        self.assertEqual(
+            (telegram.type, telegram.frequency, telegram.temperature, 
+             telegram.current, telegram.voltage),
+            ('query', frequency, temperature, current, voltage))
         # Compare sets so that the order doesn't matter.
         self.assertEqual(set(telegram.flag_bits), set(bits))
         
@@ -80,25 +80,27 @@ class TestGetParameterMode(unittest.TestCase):
 class TestCustomIntEnums(unittest.TestCase):
     """Make sure inheriting CustomInt makes enum members behave like ints."""
         
+    # Names of ControlBits members in the correct order.
+    _BITNAMES = (
+        'ON', 'UNUSED1', 'UNUSED2', 'UNUSED3', 'UNUSED4', 'X201', 
+        'SETPOINT', 'RESET_ERROR', 'STANDBY', 'UNUSED9', 'COMMAND', 
+        'X1_ERROR', 'X1_WARNING', 'X1_NORMAL', 'X202', 'X203'
+    )
+    # The corresponding enum members in order.
+    _BITS_IN_ORDER = tuple(ControlBits[name] for name in _BITNAMES)
+    
     def test_set(self):
         """Make sure sets of enum members behave as they should."""
-        
-        # Names of enum members in the correct order.
-        bitnames = [
-            'ON', 'UNUSED1', 'UNUSED2', 'UNUSED3', 'UNUSED4', 'X201', 
-            'SETPOINT', 'RESET_ERROR', 'STANDBY', 'UNUSED9', 'COMMAND', 
-            'X1_ERROR', 'X1_WARNING', 'X1_NORMAL', 'X202', 'X203'
-        ]
-        # Numbers of enum members in order.
-        bits_in_order = [ControlBits[name] for name in bitnames]
+        bits_in_order = list(self._BITS_IN_ORDER)
 
         # Print long error messages so that the order of all bits can be seen.  
         self.maxDiff = None
         
         # Unsort the bits by reversing their order.
         bits_reversed = bits_in_order[::-1]
-        # list() automatically sorts a set of ints.
-        bits_should_be_in_order = list(set(bits_reversed))
+        # The iteration order of a set is an implementation detail, so the
+        # bits are sorted explicitly.
+        bits_should_be_in_order = sorted(set(bits_reversed))
         
         # Make sure the bits are in the correct order and all of them 
         # are present (i.e. hashing works)
@@ -1,6 +1,7 @@
 """Unit tests for the parser module."""
 
 import unittest
+from functools import lru_cache
 
 from turboctl.telegram.datatypes import Uint, Sint, Float
 from turboctl.telegram.parser import (
@@ -12,6 +13,19 @@ from turboctl.telegram.parser import (
 
 # Attributes of the ErrorOrWarning class: number, name, possible_cause, remedy
 
+# TestActualParameters loops over all parameters in almost every test, 
+# so they are collected into a tuple once.
+_PARAMS = tuple(PARAMETERS.values())
+
+# The numbers of all parameters that should be defined in parameters.txt.
+_EXPECTED_NUMBERS = frozenset({
+    1,2,3,4,5,6,7,8,11,16,17,18,19,20,21,23,24,25,26,27,28,29,30,31,32,36,37,
+    38,40,41,43,119,122,125,126,128,131,132,133,134,140,150,171,174,176,179,
+    180,182,183,184,185,227,247,248,249,312,313,314,315,316,349,350,355,394,
+    395,396,601,602,604,606,609,610,611,615,616,617,618,619,620,623,624,625,
+    634,636,643,644,647,648,649,652,670,671,672,673,678,679,682,686,690,918,
+    923,924,1025,1035,1100,1101,1102})
+
 def dummy_parameter(number=1, 
                     name='Test parameter',  
                     indices=range(0), 
@@ -48,10 +62,19 @@ def dummy_parameter_from_line(number='1',
                               rw='r/w', 
                               format_='u16',
                               description='"Test description."'):
-    """Create a parameter object by parsing a line of text."""
+    """Create a parameter object by parsing a line of text.
     
-    string = ' '.join([number, name, min_value, max_value, default, unit, rw, 
-                       format_, description])
+    Identical lines are only parsed once, so the returned object may be
+    shared between tests and shouldn't be modified.
+    """
+    
+    string = (f'{number} {name} {min_value} {max_value} {default} {unit} {rw} '
+              f'{format_} {description}')
+    return _parse_parameter(string)
+
+@lru_cache(maxsize=None)
+def _parse_parameter(string):
+    """A cached version of ``parse(string, 'parameter')``."""
     return parse(string, 'parameter')
     
 
@@ -153,15 +176,12 @@ class TestParsing(unittest.TestCase):
         self.assertFalse(parameter.writable)
         
     def test_invalid_writability_fails(self):
-        
-        with self.assertRaises(ValueError):
-            dummy_parameter_from_line(rw='w')
-            
-        with self.assertRaises(ValueError):
-            dummy_parameter_from_line(rw='xyz')
+        for rw in ('w', 'xyz'):
+            with self.subTest(i=rw), self.assertRaises(ValueError):
+                dummy_parameter_from_line(rw=rw)
             
     def test_uint(self):
-        formats = ['u16', 'u32']
+        formats = ('u16', 'u32')
         
         for f in formats:
             with self.subTest(i=f):
@@ -169,7 +189,7 @@ class TestParsing(unittest.TestCase):
                 self.assertEqual(parameter.datatype, Uint)
     
     def test_sint(self):
-        formats = ['s16', 's32']
+        formats = ('s16', 's32')
         
         for f in formats:
             with self.subTest(i=f):
@@ -182,7 +202,7 @@ class TestParsing(unittest.TestCase):
         self.assertEqual(parameter.datatype, Float)
             
     def test_16_bits(self):
-        formats = ['u16', 's16']
+        formats = ('u16', 's16')
         
         for f in formats:
             with self.subTest(i=f):
@@ -190,7 +210,7 @@ class TestParsing(unittest.TestCase):
                 self.assertEqual(parameter.bits, 16)
         
     def test_32_bits(self):
-        formats = ['u32', 's32', 'real32']
+        formats = ('u32', 's32', 'real32')
         
         for f in formats:
             with self.subTest(i=f):
@@ -198,7 +218,7 @@ class TestParsing(unittest.TestCase):
                 self.assertEqual(parameter.bits, 32)
                 
     def test_invalid_bits_fails(self):
-        formats = ['16', 'x16', 'u']
+        formats = ('16', 'x16', 'u')
         
         for f in formats:
             with self.subTest(i=f):
@@ -228,92 +248,69 @@ class TestActualParameters(unittest.TestCase):
             self.assertEqual(PARAMETERS[num].number, num)
             
     def test_all_parameters_are_defined(self):
-        numbers = {1,2,3,4,5,6,7,8,11,16,17,18,19,20,21,23,24,25,26,27,28,29,
-                   30,31,32,36,37,38,40,41,43,119,122,125,126,128,131,132,133,
-                   134,140,150,171,174,176,179,180,182,183,184,185,227,247,
-                   248,249,312,313,314,315,316,349,350,355,394,395,396,601,
-                   602,604,606,609,610,611,615,616,617,618,619,620,623,624,
-                   625,634,636,643,644,647,648,649,652,670,671,672,673,678,
-                   679,682,686,690,918,923,924,1025,1035,1100,1101,1102}
-        self.assertEqual(PARAMETERS.keys(), numbers)
+        self.assertEqual(PARAMETERS.keys(), _EXPECTED_NUMBERS)
         
     # These two tests together also assert that all parameter numbers 
     # are ints (since all keys are ints and parameter numbers are equal 
     # to keys).
     
     def test_all_names_are_strings(self):
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             self.assertIsInstance(parameter.number, int)
             
     def test_all_indices_are_ranges(self):
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             self.assertIsInstance(parameter.indices, range)
             
-    def test_all_mins_are_data_or_references(self):
-        
-        for parameter in PARAMETERS.values():        
-            value = parameter.min_value
-            
-            # Convert a string value 'P<number>' to an Uint:
-            try:
-                if value[0] == 'P':
-                    value = Uint(int(value[1:]))
-            except (TypeError, ValueError):
-                pass
-            
-            self.assertIsInstance(value, (Uint, Sint, Float))
-            
-    def test_all_maxes_are_data_or_references(self):
-        
-        for parameter in PARAMETERS.values():
-            value = parameter.max_value
+    def test_all_mins_and_maxes_are_data_or_references(self):
+        for parameter in _PARAMS:
+            self.check_data_or_reference(parameter.min_value)
+            self.check_data_or_reference(parameter.max_value)
             
-            # Convert a string value 'P<number>' to an Uint:
-            try:
-                if value[0] == 'P':
-                    value = Uint(int(value[1:]))
-            except (TypeError, ValueError):
-                pass
-            
-            self.assertIsInstance(value, (Uint, Sint, Float))  
+    def check_data_or_reference(self, value):
+        """Make sure *value* is a Data instance or a 'P<number>' 
+        reference.
+        """
+        # Convert a string value 'P<number>' to an Uint:
+        try:
+            if value[0] == 'P':
+                value = Uint(int(value[1:]))
+        except (TypeError, ValueError):
+            pass
+        
+        self.assertIsInstance(value, (Uint, Sint, Float))
 
     def test_all_defaults_are_data_or_list_of_data(self):
         
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             
             value = parameter.default
-            value_is_data = type(value) in (Uint, Sint, Float)
-            value_is_list =  type(value) == list
-            try:
-                values_are_data = all([type(i) in (Uint, Sint, Float) 
-                                       for i in value])
-            except TypeError:
-                # Data instances aren't iterable and will raise this
-                # error.
-                pass
-                            
-            self.assertTrue(
-                    value_is_data or (value_is_list and values_are_data)) 
+            if type(value) in (Uint, Sint, Float):
+                continue
+            
+            self.assertIs(type(value), list)
+            self.assertTrue(all(type(i) in (Uint, Sint, Float) 
+                                for i in value))
             
     def test_all_units_are_strings(self):
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             self.assertIsInstance(parameter.unit, str) 
 
     def test_all_writable_values_are_booleans(self):
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             self.assertIsInstance(parameter.writable, bool)
 
     def test_all_datatypes_are_uint_sint_or_float(self):
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             self.assertTrue(
                     parameter.datatype in (Uint, Sint, Float))
 
     def test_all_bits_are_16_or_32(self):
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             self.assertTrue(parameter.bits in (16, 32))
 
     def test_all_descriptions_are_strings(self):
-        for parameter in PARAMETERS.values():
+        for parameter in _PARAMS:
             self.assertIsInstance(parameter.description, str)
             
             
@@ -270,9 +270,9 @@ class Sint(Data):
         See :meth:`Uint.__bytes__` for details.
         """
         # Convert self.value to an unsigned integer.
-        i = self.value
-        if i < 0:
-            i += 2**self.bits
+        # For a valid *bits* bit signed integer, masking with *bits* ones
+        # gives its two's complement representation without branching.
+        i = self.value & maxuint(self.bits)
 
         # self.value.to_bytes(self.n_bytes, 'big', signed=True)
         # only works if self.bits == BYTESIZE.
@@ -507,6 +507,11 @@ def _check_float(value, bits=4*BYTESIZE):
         raise ValueError(f'value is too large or too small: {value}')
     
     
+# The length of a binary string is checked separately, so this only needs to
+# check the characters.
+_BIN_REGEX = re.compile('[01]*')
+
+
 def _check_bin(value, bits=None):
     """Like _check_uint, but for binary strings.
     
@@ -532,8 +537,7 @@ def _check_bin(value, bits=None):
         raise ValueError(
             f'bits != len(value); bits={bits}, value={repr(value)}')
 
-    regex=f'\\A[01]{{{bits}}}\\Z'
-    if not re.match(regex, value):
+    if not _BIN_REGEX.fullmatch(value):
         raise ValueError(
             f'{repr(value)} is not a {bits} bit binary string')
 
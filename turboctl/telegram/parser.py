@@ -22,6 +22,7 @@ import ast
 import os.path
 from dataclasses import dataclass
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Union, List
 
 from turboctl.telegram.datatypes import Data, Uint, Sint, Float
@@ -140,12 +141,14 @@ def main():
     ERRORS = load_errors()
     WARNINGS = load_warnings()
 
+# The directory containing this module and the data files.
+_DIRPATH = os.path.dirname(__file__)
+
 def _fullpath(filename):
     """Return of the full path of *filename*. 
     *filename* should be a file in the same directory as this module.
     """
-    dirpath = os.path.dirname(__file__)
-    return os.path.join(dirpath, filename)
+    return os.path.join(_DIRPATH, filename)
 
 
 def load_parameters(path=None):
@@ -220,22 +223,23 @@ def _load_data(filename, type_):
         RuntimeError: If a line in *filename* cannot be parsed.
     """
     
-    with open(filename, 'r') as file:        
-        contents = file.read()
-        
-    lines = contents.split('\n')
-    
     object_list = []
-    for i, line in enumerate(lines):
-        try:
-            parsed = _parse(line, type_)
-        except ValueError as e:
-            raise RuntimeError(
-                f'Line {i+1} of {filename} could not be parsed: ' + str(e))
-        
-        # *parsed* is None for empty lines; skip those.
-        if parsed:
-            object_list.append(parsed)
+    # Lines are read from the file one at a time instead of reading the
+    # whole file into memory and splitting it.
+    with open(filename, 'r') as file:
+        for i, line in enumerate(file):
+            # _parse expects a line without a line break.
+            line = line.rstrip('\n')
+            try:
+                parsed = _parse(line, type_)
+            except ValueError as e:
+                raise RuntimeError(
+                    f'Line {i+1} of {filename} could not be parsed: '
+                    + str(e))
+
+            # *parsed* is None for empty lines; skip those.
+            if parsed:
+                object_list.append(parsed)
     
     return {p.number: p for p in object_list}
 
@@ -274,16 +278,11 @@ def _parse(line, type_):
         raise ValueError('invalid values: ' + str(e)) from e
 
 
-def _separate_fields(line):
-    """Separate the data fields contained in *line*.
-    
-    Args:
-        line: A string with no line breaks.
-        
-    Returns:
-        A list containing the data fields.
-        E.g. _separate_fields('1 2 "3 4"') -> ['1', '2', "3 4"].
-    """
+# The regular expressions used by the parsing functions are compiled once
+# here instead of being rebuilt every time a line is parsed.
+
+def _field_regex():
+    """Return a compiled regex that matches a single data field."""
     
     start = '(?: |^)' 
     # A regex that begins a data field.
@@ -312,7 +311,23 @@ def _separate_fields(line):
     
     one_or_many_words = f'({word}|{many_words})'
     field = start + one_or_many_words + end
-    return re.findall(field, line)
+    return re.compile(field)
+
+
+_FIELD_REGEX = _field_regex()
+
+
+def _separate_fields(line):
+    """Separate the data fields contained in *line*.
+    
+    Args:
+        line: A string with no line breaks.
+        
+    Returns:
+        A list containing the data fields.
+        E.g. _separate_fields('1 2 "3 4"') -> ['1', '2', "3 4"].
+    """
+    return _FIELD_REGEX.findall(line)
 
 
 def _form_object(fields, type_):
@@ -374,14 +389,8 @@ def _form_error_or_warning(fields):
     return ErrorOrWarning(number, name, possible_cause, remedy)
         
 
-def _parse_number(string):
-    """Parse the data field containg the parameter/error/warning 
-    number and possible indices.
-    
-    Returns:
-        A tuple of the number (an int) and the indices (a range object;
-        range(0) for unindexed parameters/errors/warnings).
-    """
+def _number_regex():
+    """Return a compiled regex that matches a number field."""
     any_number = '([0-9]+)'
     no_capture = '?:'
     one_or_zero_times = '?'
@@ -393,9 +402,22 @@ def _parse_number(string):
     
     numbers = f'^{any_number}{maybe_index_numbers}$'
     # <number>[<number>:<number>] or <number>
+    return re.compile(numbers)
+
 
+_NUMBER_REGEX = _number_regex()
+
+
+def _parse_number(string):
+    """Parse the data field containg the parameter/error/warning 
+    number and possible indices.
+    
+    Returns:
+        A tuple of the number (an int) and the indices (a range object;
+        range(0) for unindexed parameters/errors/warnings).
+    """
     try:
-        parts = re.findall(numbers, string)[0]
+        parts = _NUMBER_REGEX.findall(string)[0]
         # If re.findall is successful, it will return 
         # [('<num>', '<num>', '<num>')] or [('<num>', '', '')].
         # If it's unsuccessful, it will return [].
@@ -418,6 +440,10 @@ def _parse_number(string):
     return number, indices    
 
 
+# A reference to another parameter: P<number>.
+_REFERENCE_REGEX = re.compile('^P([0-9]+)$')
+
+
 def _parse_minmax(string, datatype, bits):
     """Parse a data field containg the minimum or maximum parameter
     value.
@@ -439,10 +465,7 @@ def _parse_minmax(string, datatype, bits):
         pass
     
     # If that doesn't work, try to interpret the string as a reference.     
-    any_number = '([0-9]+)'
-    P_number = f'^P{any_number}$'
-    
-    if re.match(P_number, string):
+    if _REFERENCE_REGEX.match(string):
         return string
     else:
         raise ValueError(f'invalid min/max value: {string}')    
@@ -490,18 +513,21 @@ def _parse_value(string, datatype, bits):
     return datatype(value, bits)
 
 
+# Letters followed by numbers, e.g. 'u16'.
+_FORMAT_REGEX = re.compile('^([a-z]+)([0-9]+)$')
+
+
+# There are only a handful of different format strings, so the results
+# are cached instead of being parsed again for every parameter.
+@lru_cache(maxsize=None)
 def _parse_format(string):
     """Parse the data field containg the parameter number format.
     
     Returns: A tuple containing the type (a subclass of Data) 
     and bits (16 or 32) of the parameter.
     """
-    numbers = '([0-9]+)'
-    letters = '([a-z]+)'
-    letters_and_numbers = f'^{letters}{numbers}$'
-    
     try:
-        parts = re.findall(letters_and_numbers, string)[0]
+        parts = _FORMAT_REGEX.findall(string)[0]
         # If re.findall is successful, it will return 
         # [('<letters>', '<number>')].
         # If it's unsuccessful, it will return [].
@@ -549,8 +575,9 @@ def _remove_comments(line):
           
 def _is_empty(line):
     """Returns True if *line* consists only of whitespace."""
-    empty_regex = '^\\s*$' # \s = whitespace character
-    return bool(re.match(empty_regex, line))
+    # str.isspace() uses the same definition of whitespace as \s, but
+    # returns False for an empty string.
+    return not line or line.isspace()
               
         
 def _remove_quotes(string):
@@ -56,6 +56,9 @@ class AdvancedTUI(urwid.WidgetWrap):
         self.command_line_interface = widgets.ScrollableCommandLines(
             inputfile, outputfile)
         self._stop_flag = threading.Event()
+        # The row counts of the scrollable area at the last update;
+        # see _callback().
+        self._rows = None
 
         upper_half = self.display
         divider = urwid.Divider('─')
@@ -79,8 +82,10 @@ class AdvancedTUI(urwid.WidgetWrap):
 
         This method makes self.command_line_interface.command_lines
         handle new output and re-renders
-        self.command_line_interface.scrollbar,
-        since printing new output may change its size or position.
+        self.command_line_interface.scrollbar if the size of the
+        scrollable area has changed, since printing new output or
+        typing a long command may change the size or position of the
+        scroll bar.
 
         If the program has finished its execution, this method
         breaks the UI loop.
@@ -92,12 +97,20 @@ class AdvancedTUI(urwid.WidgetWrap):
             raise urwid.ExitMainLoop
 
         self.command_line_interface.command_lines.update()
-        # _invalidate marks a widget for re-rendering.
-        # urwid documentation suggests using this method even though
-        # it begins with '_'.
-        # pylint: disable=protected-access
-        self.command_line_interface.scrollbar._invalidate()
-        # pylint: enable=protected-access
+
+        # Scroller.render updates the row counts without notifying the
+        # scroll bar; changes to the scroll position already
+        # re-render it through Position.listeners.
+        position = self.command_line_interface.position
+        rows = (position.total_rows, position.visible_rows)
+        if rows != self._rows:
+            self._rows = rows
+            # _invalidate marks a widget for re-rendering.
+            # urwid documentation suggests using this method even though
+            # it begins with '_'.
+            # pylint: disable=protected-access
+            self.command_line_interface.scrollbar._invalidate()
+            # pylint: enable=protected-access
 
         self._loop.set_alarm_in(0.01, self._callback, user_data=None)
 
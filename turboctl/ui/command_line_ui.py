@@ -117,6 +117,10 @@ class CommandLineUI:
     }
     """A dict of *width* arguments for table.table."""
 
+    # 1 == True and 0 == False, so these also match 1 and 0.
+    _on_values = frozenset({True, 'on'})
+    _off_values = frozenset({False, 'off'})
+
     def __init__(self, port=None, auto_update=True, 
                  inputfile=None, outputfile=None):
         """Initialize a new CommandLineUI.
@@ -198,16 +202,12 @@ class CommandLineUI:
         Values of '1', 'True' and 'on' turn the pump on;
         '0', 'False' and 'off' turn it off.
         """
-        # 1 == True and 0 == False.
-        if value in [True, 'on']:
+        if self._on_or_off(value):
             self.print('Turning the pump on')
             return self.control_interface.pump_on()
 
-        if value in [False, 'off']:
-            self.print('Turning the pump off')
-            return self.control_interface.pump_off()
-
-        raise ValueError('invalid value')
+        self.print('Turning the pump off')
+        return self.control_interface.pump_off()
 
     def cmd_status(self):
         """Get the status of the pump."""
@@ -350,17 +350,13 @@ class CommandLineUI:
         Activating the debug mode disables this error-catching in order
         to make debugging easier.
         """
-        # 1 == True and 0 == False.
-        if value in [True, 'on']:
+        if self._on_or_off(value):
             self.debug = True
             self.print('Debug mode activated')
 
-        elif value in [False, 'off']:
+        else:
             self.debug = False
             self.print('Debug mode deactivated')
-
-        else:
-            raise ValueError('invalid value')
             
     def cmd_verbose(self, value):
         """Activate or deactivate the verbose mode.
@@ -372,17 +368,13 @@ class CommandLineUI:
         will print all the contents of the telegram and the reply to the
         screen.
         """
-        # 1 == True and 0 == False.
-        if value in [True, 'on']:
+        if self._on_or_off(value):
             self.verbose = True
             self.print('Verbose mode activated')
 
-        elif value in [False, 'off']:
+        else:
             self.verbose = False
             self.print('Verbose mode deactivated')
-
-        else:
-            raise ValueError('invalid value')
             
     def input(self, prompt=''):
         """Ask the user for input.
@@ -492,6 +484,24 @@ class CommandLineUI:
             + textwrap.indent(str(reply), self.indent)
         )
 
+    def _on_or_off(self, value):
+        """Return ``True`` if *value* is an "on" value and ``False`` if it
+        is an "off" value.
+
+        Raises:
+            ValueError: If *value* is neither.
+        """
+        try:
+            if value in self._on_values:
+                return True
+            if value in self._off_values:
+                return False
+        except TypeError:
+            # Unhashable values such as lists are neither.
+            pass
+
+        raise ValueError('invalid value')
+
     def _get_method(self, command):
         """Return the method corresponding to *command* (a str)."""
 
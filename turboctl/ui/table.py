@@ -38,7 +38,9 @@ def table(database, numbers='all', widths={}):
             in *numbers*.
     """
     a = array(database, numbers, widths)
-    return tabulate.tabulate(a, tablefmt='plain')
+    # All cells are strings that begin with the column name, so there's no
+    # point in letting tabulate try to parse them as numbers.
+    return tabulate.tabulate(a, tablefmt='plain', disable_numparse=True)
 
 def array(database, numbers='all', widths={}):
     """The same as :func:`table`, but instead of a :class:`str` the table is
@@ -79,9 +81,11 @@ def _column_names(database):
     Raises:
         ValueError: If *database* is empty.
     """
+    # Only the first object is needed, so there's no need to copy all values
+    # of *database* into a list.
     try:
-        object_ = list(database.values())[0]
-    except KeyError as e:
+        object_ = next(iter(database.values()))
+    except StopIteration as e:
         raise ValueError('*database* is empty') from e
         
     return list(object_.fields.keys())
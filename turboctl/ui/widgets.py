@@ -121,6 +121,11 @@ class CommandLines(urwid.WidgetWrap):
         self.outputfile = outputfile
         self.history = CommandHistory()
         self.edit = urwid.Edit()
+        # Methods called by keypress() for the keys handled by this
+        # widget.
+        self._key_handlers = {'enter': self.enter,
+                              'up': self.history_up,
+                              'down': self.history_down}
         super().__init__(self.edit)
 
     def move_cursor_to_end(self):
@@ -176,16 +181,9 @@ class CommandLines(urwid.WidgetWrap):
             ``None`` if the key press was handled by this widget,
             *key* if it was not.
         """
-        if key == 'enter':
-            self.enter()
-            return None
-
-        if key == 'up':
-            self.history_up()
-            return None
-
-        if key == 'down':
-            self.history_down()
+        handler = self._key_handlers.get(key)
+        if handler:
+            handler()
             return None
 
         return super().keypress(size, key)
@@ -529,14 +527,22 @@ class ScrollBar(urwid.WidgetWrap):
         self.position = position
         self.scroller_char = scroller_char
         self.background_char = background_char
+        # The arguments used to generate the current text; see render().
+        self._text_args = None
         # A filler must be used to make this a box widget.
         widget = urwid.Filler(urwid.Text(''))
         super().__init__(widget)
 
     def render(self, size, focus=False):
         """Generate the scroll bar and render it."""
-        text = self._generate_text(size)
-        self._w.original_widget.set_text(text)
+        # The scroll bar is re-rendered many times per second, but its
+        # text only changes if *size* or the scroll position does.
+        text_args = (size, self.position.visible_rows,
+                     self.position.total_rows, self.position.relative)
+        if text_args != self._text_args:
+            self._text_args = text_args
+            text = self._generate_text(size)
+            self._w.original_widget.set_text(text)
         return super().render(size, focus)
 
     def _generate_text(self, size):